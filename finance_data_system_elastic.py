@@ -5,54 +5,200 @@
 支持新浪财经、东方财富网数据抓取，并提供完整的 API 接口
 """
 
+import asyncio
+import hashlib
 import logging
-import json
+import os
+import re
+import socket
+import threading
 import time
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+import weakref
+from contextlib import asynccontextmanager, contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Any, Optional, Tuple
+from urllib.parse import urlparse
+import aiohttp
+import lxml.html
+import msgspec
+from lxml import etree
+import orjson
+from cachetools import TTLCache
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 from flask import Flask, jsonify, request
+from flask.json.provider import DefaultJSONProvider
+from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from elasticsearch import Elasticsearch, helpers
+from elasticsearch.serializer import OrjsonSerializer
 import pytz
 
 # 配置日志
 import logging.handlers
 
+# 控制台输出
+log_handlers = [logging.StreamHandler()]
+# RotatingFileHandler 不能跨进程共享：gunicorn 多个 worker 各自轮转同一文件会互相覆盖备份、丢失日志，
+# 因此在 gunicorn(master 会设置 SERVER_SOFTWARE)下只输出到 stderr，由 gunicorn 汇总写入错误日志
+if not os.environ.get('SERVER_SOFTWARE', '').startswith('gunicorn/'):
+    # 文件日志轮转，每个文件最大10MB，保留5个备份
+    log_handlers.insert(0, logging.handlers.RotatingFileHandler(
+        'finance_system.log', 
+        maxBytes=10*1024*1024,  # 10MB
+        backupCount=5,
+        encoding='utf-8'
+    ))
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        # 文件日志轮转，每个文件最大10MB，保留5个备份
-        logging.handlers.RotatingFileHandler(
-            'finance_system.log', 
-            maxBytes=10*1024*1024,  # 10MB
-            backupCount=5,
-            encoding='utf-8'
-        ),
-        # 控制台输出
-        logging.StreamHandler()
-    ]
+    handlers=log_handlers
 )
 logger = logging.getLogger(__name__)
 
+def _keyword_pattern(keywords: List[str]) -> re.Pattern:
+    """将关键词列表编译为单个正则，每篇文档只需扫描一次"""
+    return re.compile('|'.join(map(re.escape, keywords)))
+
+# 标签与情绪关键词
+TAG_PATTERN = _keyword_pattern(['涨停', '跌停', '利好', '利空', '重组', '并购', '业绩', '财报'])
+MARKET_POSITIVE_PATTERN = _keyword_pattern(['利好', '上涨', '突破', '创新高'])
+MARKET_NEGATIVE_PATTERN = _keyword_pattern(['利空', '下跌', '破位', '创新低'])
+SENTIMENT_PATTERNS = {
+    'positive': _keyword_pattern(['利好', '上涨', '突破']),
+    'negative': _keyword_pattern(['利空', '下跌', '破位'])
+}
+
+# 数值单元格：整个单元格只能是一个数值(允许省略整数部分，如 '.5')加可选的百分号，
+# 指数、单位等其他写法一律拒绝，避免只取到前半段而存入数量级错误的值；匹配前先用 FLOAT_CLEAN_TABLE 清洗
+FLOAT_PATTERN = re.compile(r'(-?(?:\d+(?:\.\d+)?|\.\d+))\s*%?')
+# 去掉千分位逗号，并把 Unicode 负号 '−' 统一为 '-'
+FLOAT_CLEAN_TABLE = str.maketrans({',': None, '\u2212': '-'})
+
+# 抓取主机的 DNS 解析缓存，同步(requests)与异步(aiohttp)抓取共用
+DNS_CACHE_TTL = 3600
+_DNS_CACHE: Dict[Tuple[str, Any], Tuple[list, float]] = {}
+_DNS_CACHE_LOCK = threading.Lock()
+_DNS_CACHED_HOSTS = set()
+_original_getaddrinfo = None
+
+def _cached_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+    """只对抓取主机生效的 getaddrinfo 缓存，按 (host, port) 缓存全部地址后再按参数过滤"""
+    if host not in _DNS_CACHED_HOSTS:
+        return _original_getaddrinfo(host, port, family, type, proto, flags)
+    
+    key = (host, port)
+    now = time.monotonic()
+    with _DNS_CACHE_LOCK:
+        cached = _DNS_CACHE.get(key)
+    if cached is None or cached[1] <= now:
+        addresses = _original_getaddrinfo(host, port)
+        with _DNS_CACHE_LOCK:
+            _DNS_CACHE[key] = (addresses, now + DNS_CACHE_TTL)
+    else:
+        addresses = cached[0]
+    
+    return [
+        address for address in addresses
+        if (not family or address[0] == family)
+        and (not type or address[1] == type)
+        and (not proto or address[2] == proto)
+    ]
+
+def enable_dns_cache(hosts: Iterable[str]):
+    """为指定主机启用进程内 DNS 缓存，首次调用时替换 socket.getaddrinfo"""
+    global _original_getaddrinfo
+    _DNS_CACHED_HOSTS.update(hosts)
+    if _original_getaddrinfo is None:
+        _original_getaddrinfo = socket.getaddrinfo
+        socket.getaddrinfo = _cached_getaddrinfo
+
+def _class_xpath(class_name: str, axis: str = '//') -> str:
+    """生成等价于 CSS 类选择器的 XPath 表达式"""
+    return f"{axis}*[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+
+# 页面选择器在导入时编译一次，解析循环中直接复用
+SINA_ITEM_XPATH = etree.XPath(_class_xpath('bd_i'))
+SINA_CONTENT_XPATH = etree.XPath(_class_xpath('bd_i_txt_c', './/'))
+SINA_TIME_XPATH = etree.XPath(_class_xpath('bd_i_time', './/'))
+NEWSTOCK_ROW_XPATH = etree.XPath('//table//tbody//tr')
+NEWSTOCK_CELL_XPATH = etree.XPath('.//td')
+INDUSTRY_ARTICLE_XPATH = etree.XPath(_class_xpath('news-item'))
+INDUSTRY_TITLE_XPATH = etree.XPath(_class_xpath('title', './/'))
+TEXT_NODES_XPATH = etree.XPath('.//text()')
+
+def _html_parser() -> lxml.html.HTMLParser:
+    """按 UTF-8 直接解析原始字节的增量解析器，可边下载边喂入数据"""
+    return lxml.html.HTMLParser(encoding='utf-8')
+
+def _now_iso() -> str:
+    """带本地时区偏移的当前时间，供同一批次的文档共用"""
+    return datetime.now(timezone.utc).astimezone().isoformat()
+
+def _element_text(element) -> str:
+    """拼接元素下所有去除首尾空白的文本节点"""
+    return ''.join(text.strip() for text in TEXT_NODES_XPATH(element))
+
+def _struct_fragment(struct: msgspec.Struct) -> orjson.Fragment:
+    """由 msgspec 直接编码 Struct，作为 JSON 片段原样嵌入 orjson 输出"""
+    return orjson.Fragment(msgspec.json.encode(struct))
+
+class DocumentSerializer(OrjsonSerializer):
+    """Elasticsearch 请求序列化，可直接写入 msgspec Struct 文档"""
+    
+    def default(self, data: Any) -> Any:
+        if isinstance(data, msgspec.Struct):
+            return _struct_fragment(data)
+        return super().default(data)
+
 class ElasticsearchClient:
     """Elasticsearch 客户端管理类"""
     
-    def __init__(self, hosts: List[str] = None):
+    REFRESH_INTERVAL = '60s'
+    # 抓取数据索引可随时重新抓取，允许以持久性换取写入速度；分析结果与策略索引保持默认设置
+    CRAWL_INDICES = ('sina_live_data', 'eastmoney_newstock_data', 'eastmoney_industry_data')
+    SEARCH_CACHE_SIZE = 64
+    SEARCH_CACHE_TTL = 60
+    HEALTH_CHECK_INTERVAL = 15
+    WARM_UP_TIMEOUT = 2
+    
+    def __init__(self, hosts: List[str] = None, chunk_size: int = None,
+                 max_chunk_bytes: int = None, thread_count: int = None):
         if hosts is None:
             hosts = ['http://localhost:9200']
         
-        self.es = Elasticsearch(hosts)
+        # 批量写入参数，默认值按 chunk_size ≤ max_chunk_bytes / 平均文档大小(约4KB) 估算
+        if chunk_size is None:
+            chunk_size = int(os.environ.get('ES_BULK_CHUNK_SIZE', 2500))
+        if max_chunk_bytes is None:
+            max_chunk_bytes = int(os.environ.get('ES_BULK_MAX_CHUNK_BYTES', 10*1024*1024))
+        if thread_count is None:
+            thread_count = int(os.environ.get('ES_BULK_THREAD_COUNT', 4))
+        self.chunk_size = chunk_size
+        self.max_chunk_bytes = max_chunk_bytes
+        self.thread_count = thread_count
+        
+        # 分析任务的滚动窗口查询结果缓存，调度器与 API 线程共享，需加锁访问
+        self._search_cache = TTLCache(maxsize=self.SEARCH_CACHE_SIZE, ttl=self.SEARCH_CACHE_TTL)
+        self._search_cache_lock = threading.Lock()
+        
+        self.es = Elasticsearch(hosts, serializer=DocumentSerializer())
+        self._es_alive = False
+        self._es_checked_at = 0.0
+        # 同一时刻只允许一个探测在途，其余调用方直接读取缓存状态
+        self._health_lock = threading.Lock()
+        self._health_refresher_stop = threading.Event()
+        self._health_refresher = None
         self._check_connection()
         self._create_indices()
     
     def _check_connection(self):
         """检查 Elasticsearch 连接"""
         try:
-            if self.es.ping():
+            if self.refresh_health():
                 logger.info("成功连接到 Elasticsearch")
             else:
                 logger.error("无法连接到 Elasticsearch")
@@ -61,13 +207,63 @@ class ElasticsearchClient:
             logger.error(f"Elasticsearch 连接错误: {e}")
             raise
     
+    def refresh_health(self) -> bool:
+        """探测 Elasticsearch 是否可用并缓存结果"""
+        with self._health_lock:
+            return self._ping()
+    
+    def _ping(self) -> bool:
+        """执行一次探测并记录结果，调用方需持有 _health_lock"""
+        try:
+            alive = bool(self.es.ping())
+        except Exception:
+            alive = False
+        self._es_alive = alive
+        self._es_checked_at = time.monotonic()
+        return alive
+    
+    def is_alive(self) -> bool:
+        """返回缓存的连接状态；定时刷新未运行导致结果过旧时才重新探测，已有探测在途时直接返回缓存值"""
+        if (time.monotonic() - self._es_checked_at > self.HEALTH_CHECK_INTERVAL * 4
+                and self._health_lock.acquire(blocking=False)):
+            try:
+                return self._ping()
+            finally:
+                self._health_lock.release()
+        return self._es_alive
+    
+    def start_health_refresher(self):
+        """启动后台线程定时刷新 is_alive 使用的连接状态"""
+        if self._health_refresher is not None:
+            return
+        self._health_refresher = threading.Thread(
+            target=self._refresh_health_loop, name='es-health-refresher', daemon=True
+        )
+        self._health_refresher.start()
+    
+    def stop_health_refresher(self):
+        """停止后台健康检查线程"""
+        self._health_refresher_stop.set()
+    
+    def _refresh_health_loop(self):
+        while not self._health_refresher_stop.wait(self.HEALTH_CHECK_INTERVAL):
+            self.refresh_health()
+    
+    def warm_up(self):
+        """预先建立到 Elasticsearch 的连接"""
+        try:
+            self.es.options(request_timeout=self.WARM_UP_TIMEOUT, max_retries=0).cluster.health()
+        except Exception as e:
+            logger.warning(f"Elasticsearch 预热失败: {e}")
+    
     def _create_indices(self):
         """创建所有必要的索引"""
         indices = {
             'sina_live_data': {
                 'mappings': {
                     'properties': {
-                        'content': {'type': 'text', 'analyzer': 'standard'},
+                        # 正文只随 _source 读取、从不参与检索，关闭索引以省去分词与倒排开销
+                        'content': {'type': 'text', 'index': False},
                         'publish_time': {'type': 'date'},
                         'source': {'type': 'keyword'},
                         'author': {'type': 'keyword'},
@@ -127,9 +323,20 @@ class ElasticsearchClient:
             }
         }
         
+        # 抓取数据索引：放宽刷新间隔、单节点不设副本、异步落盘 translog
+        crawl_index_settings = {
+            'index': {
+                'refresh_interval': self.REFRESH_INTERVAL,
+                'number_of_replicas': 0,
+                'translog.durability': 'async'
+            }
+        }
+        
         for index_name, index_body in indices.items():
             try:
                 if not self.es.indices.exists(index=index_name):
+                    if index_name in self.CRAWL_INDICES:
+                        index_body = dict(index_body, settings=crawl_index_settings)
                     self.es.indices.create(index=index_name, body=index_body)
                     logger.info(f"创建索引: {index_name}")
                 else:
@@ -137,9 +344,25 @@ class ElasticsearchClient:
             except Exception as e:
                 logger.error(f"创建索引 {index_name} 失败: {e}")
     
+    @contextmanager
+    def _slow_refresh(self, index: str):
+        """大批量写入期间关闭索引刷新，结束后恢复"""
+        self.es.indices.put_settings(index=index, body={'index': {'refresh_interval': '-1'}})
+        try:
+            yield
+        finally:
+            self.es.indices.put_settings(
+                index=index, body={'index': {'refresh_interval': self.REFRESH_INTERVAL}}
+            )
+    
     def bulk_insert(self, index: str, documents: List[Dict]):
         """批量插入文档"""
-        if not documents:
+        return self.bulk_insert_many({index: documents})
+    
+    def bulk_insert_many(self, documents_by_index: Dict[str, List[Dict]]):
+        """将多个索引的文档合并为一次批量请求写入"""
+        indices = [index for index, documents in documents_by_index.items() if documents]
+        if not indices:
             return
         
         actions = [
@@ -147,65 +370,177 @@ class ElasticsearchClient:
                 '_index': index,
                 '_source': doc
             }
-            for doc in documents
+            for index in indices
+            for doc in documents_by_index[index]
         ]
+        index_names = ','.join(indices)
+        slow_refresh_indices = [index for index in indices if index in self.CRAWL_INDICES]
         
         try:
-            success, failed = helpers.bulk(self.es, actions, raise_on_error=False)
-            logger.info(f"批量插入 {index}: 成功 {success} 条, 失败 {len(failed)} 条")
+            if len(actions) >= self.chunk_size and slow_refresh_indices:
+                with self._slow_refresh(','.join(slow_refresh_indices)):
+                    success, failed = self._parallel_bulk(actions)
+            else:
+                success, failed = self._parallel_bulk(actions)
+            logger.info(f"批量插入 {index_names}: 成功 {success} 条, 失败 {len(failed)} 条")
             return success, failed
         except Exception as e:
             logger.error(f"批量插入失败: {e}")
-            return 0, len(documents)
+            return 0, len(actions)
+    
+    def _parallel_bulk(self, actions: List[Dict]):
+        """多线程分块提交批量请求，返回成功数和失败明细"""
+        success, failed = 0, []
+        for ok, info in helpers.parallel_bulk(
+            self.es,
+            actions,
+            thread_count=self.thread_count,
+            chunk_size=self.chunk_size,
+            max_chunk_bytes=self.max_chunk_bytes,
+            queue_size=4,
+            raise_on_error=False
+        ):
+            if ok:
+                success += 1
+            else:
+                failed.append(info)
+        return success, failed
     
-    def search(self, index: str, query: Dict, size: int = 10) -> List[Dict]:
-        """搜索文档"""
+    def search(self, index: str, query: Dict, size: int = 10,
+               source_fields: Optional[List[str]] = None) -> List[Dict]:
+        """搜索文档，指定 source_fields 时只返回这些字段且不统计命中总数"""
+        if source_fields is not None:
+            query = dict(query, _source=source_fields, track_total_hits=False)
+        
         try:
             response = self.es.search(index=index, body=query, size=size)
             return [hit['_source'] for hit in response['hits']['hits']]
         except Exception as e:
             logger.error(f"搜索失败: {e}")
             return []
+    
+    def cached_search(self, index: str, query: Dict, size: int = 10,
+                      source_fields: Optional[List[str]] = None) -> List[Dict]:
+        """带短期缓存的搜索，时间窗口应按分钟取整（如 now-2h/m）以便命中缓存"""
+        query_hash = hashlib.blake2b(orjson.dumps(query, option=orjson.OPT_SORT_KEYS)).digest()
+        key = (index, query_hash, size, tuple(source_fields) if source_fields is not None else None)
+        
+        with self._search_cache_lock:
+            results = self._search_cache.get(key)
+        if results is not None:
+            return results
+        
+        results = self.search(index, query, size, source_fields)
+        # 空结果可能来自查询失败，不做缓存
+        if results:
+            with self._search_cache_lock:
+                self._search_cache[key] = results
+        return results
+
+class HostRateLimiter:
+    """按主机限制并发请求数，并保证同一主机相邻请求的最小间隔
+    
+    请求时刻表以 time.monotonic() 计时并由线程锁保护，同一实例可在多个线程各自的
+    asyncio.run 之间共享；信号量依附于事件循环，因此按事件循环分别创建
+    """
+    
+    def __init__(self, concurrency: int = 4, min_interval: float = 0.25):
+        self.concurrency = concurrency
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_slot: Dict[str, float] = {}
+        self._semaphores = weakref.WeakKeyDictionary()
+    
+    def _semaphore(self, host: str) -> asyncio.Semaphore:
+        """当前事件循环中目标主机的并发信号量"""
+        with self._lock:
+            semaphores = self._semaphores.setdefault(asyncio.get_running_loop(), {})
+            if host not in semaphores:
+                semaphores[host] = asyncio.Semaphore(self.concurrency)
+            return semaphores[host]
+    
+    def _reserve_slot(self, host: str) -> float:
+        """预约目标主机的下一个请求时刻，返回需要等待的秒数"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.min_interval
+        return slot - now
+    
+    @asynccontextmanager
+    async def limit(self, url: str):
+        """占用目标主机的一个并发名额，并等待到下一个可用的请求时刻"""
+        host = urlparse(url).netloc
+        async with self._semaphore(host):
+            await asyncio.sleep(self._reserve_slot(host))
+            yield
 
 class DataCrawler:
     """数据抓取类"""
     
+    # 遇到限流或服务端错误时的重试策略，同步与异步抓取共用
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    RETRY_TOTAL = 3
+    RETRY_BACKOFF_FACTOR = 0.3
+    STREAM_CHUNK_SIZE = 64 * 1024
+    # 预热只尝试一次且快速失败，避免目标不可达时拖过 gunicorn worker 启动超时
+    WARM_UP_TIMEOUT = 2
+    
+    SINA_LIVE_URL = "https://finance.sina.com.cn/7x24/"
+    EASTMONEY_NEWSTOCK_URL = "http://data.eastmoney.com/xg/xg/default.html"
+    EASTMONEY_INDUSTRY_URL = "http://finance.eastmoney.com/a/{industry}.html"
+    INDUSTRIES = ('tech', 'finance', 'healthcare', 'consumer', 'industrial', 'energy')
+    
     def __init__(self, es_client: ElasticsearchClient):
         self.es_client = es_client
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
+        
+        # 复用同一个会话的连接池，避免每次请求重新建立 TCP/TLS 连接
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=self.RETRY_TOTAL,
+                backoff_factor=self.RETRY_BACKOFF_FACTOR,
+                status_forcelist=self.RETRY_STATUSES,
+                # 重试耗尽仍是限流/服务端错误时抛出异常，而不是把错误页当作数据解析入库
+                raise_on_status=True
+            )
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # 限流状态随抓取器常驻，同时触发的多次抓取(定时任务与 /crawl/now)共用同一份请求时刻表
+        self.limiter = HostRateLimiter(concurrency=4, min_interval=0.25)
+        
+        enable_dns_cache(urlparse(base_url).hostname for base_url in self._base_urls())
+    
+    def _base_urls(self) -> List[str]:
+        """各抓取主机的根地址"""
+        urls = (self.SINA_LIVE_URL, self.EASTMONEY_NEWSTOCK_URL, self.EASTMONEY_INDUSTRY_URL)
+        return list(dict.fromkeys(f"{parsed.scheme}://{parsed.netloc}/" for parsed in map(urlparse, urls)))
+    
+    def warm_up(self):
+        """预先解析各抓取主机(写入 DNS 缓存)并建立长连接"""
+        for base_url in self._base_urls():
+            try:
+                # 直接使用会话底层的连接池发请求：连接仍归会话复用，但绕过适配器的重试策略
+                pool = self.session.get_adapter(base_url).poolmanager.connection_from_url(base_url)
+                pool.urlopen('HEAD', '/', retries=False, timeout=self.WARM_UP_TIMEOUT)
+            except Exception as e:
+                logger.warning(f"预热 {base_url} 失败: {e}")
     
     def crawl_sina_live(self) -> List[Dict]:
         """抓取新浪财经直播数据"""
         logger.info("开始抓取新浪财经直播数据")
-        url = "https://finance.sina.com.cn/7x24/"
         
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.encoding = 'utf-8'
-            soup = BeautifulSoup(response.text, 'lxml')
-            
-            data_list = []
-            items = soup.select('.bd_i')[:20]
-            
-            for item in items:
-                try:
-                    content = item.select_one('.bd_i_txt_c').get_text(strip=True)
-                    time_str = item.select_one('.bd_i_time').get_text(strip=True)
-                    
-                    data = {
-                        'content': content,
-                        'publish_time': datetime.now().isoformat(),
-                        'source': 'sina_finance',
-                        'author': '新浪财经',
-                        'create_time': datetime.now().isoformat(),
-                        'tags': self._extract_tags(content)
-                    }
-                    data_list.append(data)
-                except Exception as e:
-                    logger.warning(f"解析单条数据失败: {e}")
-                    continue
+            tree = self._fetch(self.SINA_LIVE_URL)
+            data_list = self._parse_sina_live(tree)
             
             if data_list:
                 self.es_client.bulk_insert('sina_live_data', data_list)
@@ -220,36 +555,10 @@ class DataCrawler:
     def crawl_eastmoney_newstock(self) -> List[Dict]:
         """抓取东方财富网新股数据"""
         logger.info("开始抓取东方财富网新股数据")
-        url = "http://data.eastmoney.com/xg/xg/default.html"
         
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.encoding = 'utf-8'
-            soup = BeautifulSoup(response.text, 'lxml')
-            
-            data_list = []
-            rows = soup.select('table tbody tr')[:10]
-            
-            for row in rows:
-                try:
-                    cols = row.select('td')
-                    if len(cols) < 6:
-                        continue
-                    
-                    data = {
-                        'stock_code': cols[0].get_text(strip=True),
-                        'stock_name': cols[1].get_text(strip=True),
-                        'issue_price': self._parse_float(cols[2].get_text(strip=True)),
-                        'issue_date': cols[3].get_text(strip=True),
-                        'listing_date': cols[4].get_text(strip=True),
-                        'pe_ratio': self._parse_float(cols[5].get_text(strip=True)),
-                        'industry': cols[6].get_text(strip=True) if len(cols) > 6 else '',
-                        'create_time': datetime.now().isoformat()
-                    }
-                    data_list.append(data)
-                except Exception as e:
-                    logger.warning(f"解析新股数据失败: {e}")
-                    continue
+            tree = self._fetch(self.EASTMONEY_NEWSTOCK_URL)
+            data_list = self._parse_eastmoney_newstock(tree)
             
             if data_list:
                 self.es_client.bulk_insert('eastmoney_newstock_data', data_list)
@@ -264,34 +573,11 @@ class DataCrawler:
     def crawl_eastmoney_industry(self, industry: str) -> List[Dict]:
         """抓取东方财富网产业板块数据"""
         logger.info(f"开始抓取东方财富网 {industry} 板块数据")
-        url = f"http://finance.eastmoney.com/a/{industry}.html"
+        url = self.EASTMONEY_INDUSTRY_URL.format(industry=industry)
         
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.encoding = 'utf-8'
-            soup = BeautifulSoup(response.text, 'lxml')
-            
-            data_list = []
-            articles = soup.select('.news-item')[:10]
-            
-            for article in articles:
-                try:
-                    title_elem = article.select_one('.title')
-                    title = title_elem.get_text(strip=True) if title_elem else ''
-                    url_link = title_elem.get('href', '') if title_elem else ''
-                    
-                    data = {
-                        'title': title,
-                        'content': '',
-                        'industry': industry,
-                        'publish_time': datetime.now().isoformat(),
-                        'url': url_link,
-                        'create_time': datetime.now().isoformat()
-                    }
-                    data_list.append(data)
-                except Exception as e:
-                    logger.warning(f"解析产业板块数据失败: {e}")
-                    continue
+            tree = self._fetch(url)
+            data_list = self._parse_eastmoney_industry(tree, industry)
             
             if data_list:
                 self.es_client.bulk_insert('eastmoney_industry_data', data_list)
@@ -303,153 +589,407 @@ class DataCrawler:
             logger.error(f"抓取 {industry} 板块数据失败: {e}")
             return []
     
-    def _parse_float(self, value: str) -> float:
-        """解析浮点数"""
+    def crawl_all(self, industries: Iterable[str] = INDUSTRIES) -> Dict[str, List[Dict]]:
+        """并发抓取全部数据源，并通过一次批量请求写入各索引"""
+        sina_data, newstock_data, industry_data = asyncio.run(self.crawl_all_async(industries))
+        
+        documents = {
+            'sina_live_data': sina_data,
+            'eastmoney_newstock_data': newstock_data,
+            'eastmoney_industry_data': industry_data
+        }
+        self.es_client.bulk_insert_many(documents)
+        return documents
+    
+    async def crawl_all_async(self, industries: Iterable[str]) -> List[List[Dict]]:
+        """并发抓取全部数据源，同一主机的请求受并发数与请求间隔限制"""
+        limiter = self.limiter
+        connector = aiohttp.TCPConnector(
+            limit_per_host=8,
+            keepalive_timeout=30,
+            ttl_dns_cache=DNS_CACHE_TTL,
+            family=socket.AF_INET
+        )
+        timeout = aiohttp.ClientTimeout(total=10)
+        
+        async with aiohttp.ClientSession(
+            connector=connector, headers=self.headers, timeout=timeout
+        ) as session:
+            return await asyncio.gather(
+                self.crawl_sina_live_async(session, limiter),
+                self.crawl_eastmoney_newstock_async(session, limiter),
+                self.crawl_eastmoney_industries_async(industries, session, limiter)
+            )
+    
+    async def crawl_sina_live_async(self, session: aiohttp.ClientSession,
+                                    limiter: HostRateLimiter) -> List[Dict]:
+        """异步抓取新浪财经直播数据，只返回解析结果，由调用方统一写入"""
+        logger.info("开始抓取新浪财经直播数据")
+        
         try:
-            return float(value.replace(',', '').replace('%', ''))
-        except:
-            return 0.0
+            tree = await self._fetch_async(session, self.SINA_LIVE_URL, limiter)
+            data_list = self._parse_sina_live(tree)
+            
+            logger.info(f"新浪财经直播数据抓取完成，共 {len(data_list)} 条")
+            return data_list
+        
+        except Exception as e:
+            logger.error(f"抓取新浪财经直播数据失败: {e}")
+            return []
+    
+    async def crawl_eastmoney_newstock_async(self, session: aiohttp.ClientSession,
+                                             limiter: HostRateLimiter) -> List[Dict]:
+        """异步抓取东方财富网新股数据，只返回解析结果，由调用方统一写入"""
+        logger.info("开始抓取东方财富网新股数据")
+        
+        try:
+            tree = await self._fetch_async(session, self.EASTMONEY_NEWSTOCK_URL, limiter)
+            data_list = self._parse_eastmoney_newstock(tree)
+            
+            logger.info(f"东方财富网新股数据抓取完成，共 {len(data_list)} 条")
+            return data_list
+        
+        except Exception as e:
+            logger.error(f"抓取东方财富网新股数据失败: {e}")
+            return []
+    
+    async def crawl_eastmoney_industry_async(self, industry: str, session: aiohttp.ClientSession,
+                                             limiter: HostRateLimiter) -> List[Dict]:
+        """异步抓取东方财富网产业板块数据，只返回解析结果，由调用方统一写入"""
+        logger.info(f"开始抓取东方财富网 {industry} 板块数据")
+        url = self.EASTMONEY_INDUSTRY_URL.format(industry=industry)
+        
+        try:
+            tree = await self._fetch_async(session, url, limiter)
+            data_list = self._parse_eastmoney_industry(tree, industry)
+            
+            logger.info(f"{industry} 板块数据抓取完成，共 {len(data_list)} 条")
+            return data_list
+        
+        except Exception as e:
+            logger.error(f"抓取 {industry} 板块数据失败: {e}")
+            return []
+    
+    async def crawl_eastmoney_industries_async(self, industries: Iterable[str], session: aiohttp.ClientSession,
+                                               limiter: HostRateLimiter) -> List[Dict]:
+        """并发抓取多个产业板块，合并为一个结果列表"""
+        results = await asyncio.gather(*(
+            self.crawl_eastmoney_industry_async(industry, session, limiter)
+            for industry in industries
+        ))
+        return [doc for data_list in results for doc in data_list]
+    
+    def _fetch(self, url: str):
+        """流式下载页面并直接把字节块喂给解析器，返回文档根节点"""
+        with self.session.get(url, timeout=10, stream=True) as response:
+            parser = _html_parser()
+            for chunk in response.iter_content(chunk_size=self.STREAM_CHUNK_SIZE):
+                parser.feed(chunk)
+            return parser.close()
+    
+    async def _fetch_async(self, session: aiohttp.ClientSession, url: str,
+                           limiter: HostRateLimiter):
+        """按主机限流流式获取并解析页面，遇到 429/5xx 时指数退避重试，重试耗尽后抛出异常"""
+        for attempt in range(self.RETRY_TOTAL + 1):
+            async with limiter.limit(url):
+                async with session.get(url) as response:
+                    if response.status not in self.RETRY_STATUSES:
+                        parser = _html_parser()
+                        async for chunk in response.content.iter_chunked(self.STREAM_CHUNK_SIZE):
+                            parser.feed(chunk)
+                        return parser.close()
+                    if attempt == self.RETRY_TOTAL:
+                        response.raise_for_status()
+            
+            logger.warning(f"请求 {url} 返回 {response.status}，第 {attempt + 1} 次重试")
+            await asyncio.sleep(self.RETRY_BACKOFF_FACTOR * (2 ** attempt))
+    
+    def _parse_sina_live(self, tree) -> List[Dict]:
+        """解析新浪财经直播页面"""
+        now_iso = _now_iso()
+        data_list = []
+        items = SINA_ITEM_XPATH(tree)[:20]
+        
+        for item in items:
+            try:
+                content = _element_text(SINA_CONTENT_XPATH(item)[0])
+                time_str = _element_text(SINA_TIME_XPATH(item)[0])
+                
+                data = {
+                    'content': content,
+                    'publish_time': now_iso,
+                    'source': 'sina_finance',
+                    'author': '新浪财经',
+                    'create_time': now_iso,
+                    'tags': self._extract_tags(content)
+                }
+                data_list.append(data)
+            except Exception as e:
+                logger.warning(f"解析单条数据失败: {e}")
+                continue
+        
+        return data_list
+    
+    def _parse_eastmoney_newstock(self, tree) -> List[Dict]:
+        """解析东方财富网新股页面"""
+        now_iso = _now_iso()
+        data_list = []
+        rows = NEWSTOCK_ROW_XPATH(tree)[:10]
+        
+        for row in rows:
+            try:
+                cols = [_element_text(col) for col in NEWSTOCK_CELL_XPATH(row)]
+                if len(cols) < 6:
+                    continue
+                
+                data = {
+                    'stock_code': cols[0],
+                    'stock_name': cols[1],
+                    'issue_price': self._parse_float(cols[2]),
+                    'issue_date': cols[3],
+                    'listing_date': cols[4],
+                    'pe_ratio': self._parse_float(cols[5]),
+                    'industry': cols[6] if len(cols) > 6 else '',
+                    'create_time': now_iso
+                }
+                data_list.append(data)
+            except Exception as e:
+                logger.warning(f"解析新股数据失败: {e}")
+                continue
+        
+        return data_list
+    
+    def _parse_eastmoney_industry(self, tree, industry: str) -> List[Dict]:
+        """解析东方财富网产业板块页面"""
+        now_iso = _now_iso()
+        data_list = []
+        articles = INDUSTRY_ARTICLE_XPATH(tree)[:10]
+        
+        for article in articles:
+            try:
+                title_elems = INDUSTRY_TITLE_XPATH(article)
+                title_elem = title_elems[0] if title_elems else None
+                title = _element_text(title_elem) if title_elem is not None else ''
+                url_link = title_elem.get('href', '') if title_elem is not None else ''
+                
+                data = {
+                    'title': title,
+                    'content': '',
+                    'industry': industry,
+                    'publish_time': now_iso,
+                    'url': url_link,
+                    'create_time': now_iso
+                }
+                data_list.append(data)
+            except Exception as e:
+                logger.warning(f"解析产业板块数据失败: {e}")
+                continue
+        
+        return data_list
+    
+    def _parse_float(self, value: str) -> float:
+        """解析数值单元格，无法完整解析时返回 0.0
+        
+        '1,234.5' -> 1234.5, '1234,567' -> 1234567.0, '.5' -> 0.5,
+        '−3'(Unicode 负号) -> -3.0, '12.5%' -> 12.5, '-'/'' -> 0.0,
+        '1e3'/'1.5万' -> 0.0 并记录警告(不支持指数与单位)
+        """
+        cleaned = value.translate(FLOAT_CLEAN_TABLE).strip()
+        match = FLOAT_PATTERN.fullmatch(cleaned)
+        if match:
+            return float(match.group(1))
+        # '-'、'--' 与空串是页面上的缺失值占位符，其余无法解析的内容视为数据质量问题
+        if cleaned.strip('-'):
+            logger.warning(f"无法解析数值 {value!r}，按 0.0 处理")
+        else:
+            logger.debug(f"数值缺失 {value!r}，按 0.0 处理")
+        return 0.0
     
     def _extract_tags(self, content: str) -> List[str]:
         """从内容中提取标签"""
-        keywords = ['涨停', '跌停', '利好', '利空', '重组', '并购', '业绩', '财报']
-        return [kw for kw in keywords if kw in content]
+        return list(dict.fromkeys(TAG_PATTERN.findall(content)))
+
+class StrategyDoc(msgspec.Struct, kw_only=True):
+    """交易策略文档，对应 trading_strategies 索引"""
+    type: str
+    strategy: str
+    risk_level: str
+    target_stocks: List[str]
+    confidence: float
+    create_time: str
+    data_summary: Dict[str, int]
+
+class AnalysisDoc(msgspec.Struct, kw_only=True):
+    """分析结果文档，对应 analysis_results 索引"""
+    analysis_type: str
+    content: str
+    data_source: str
+    metrics: Dict[str, Any]
+    create_time: str
 
 class DataAnalyzer:
     """数据分析类"""
     
+    PRE_MARKET_MAX_AGE = 30
+    
     def __init__(self, es_client: ElasticsearchClient):
         self.es_client = es_client
+        # 最近一次生成的盘前策略及其生成时刻(monotonic)
+        self._pre_market_cache: Optional[Tuple[StrategyDoc, float]] = None
+        self._pre_market_lock = threading.Lock()
+    
+    def get_pre_market_strategy(self) -> StrategyDoc:
+        """获取盘前策略，PRE_MARKET_MAX_AGE 秒内复用最近一次生成的结果"""
+        with self._pre_market_lock:
+            cached = self._pre_market_cache
+            if cached is not None and time.monotonic() - cached[1] < self.PRE_MARKET_MAX_AGE:
+                return cached[0]
+            return self.generate_pre_market_strategy()
     
-    def generate_pre_market_strategy(self) -> Dict:
+    def generate_pre_market_strategy(self) -> StrategyDoc:
         """生成盘前策略"""
         logger.info("生成盘前策略")
         
-        query = {
+        news_query = {
+            'query': {
+                'range': {
+                    'publish_time': {
+                        'gte': 'now-24h/m'
+                    }
+                }
+            },
+            'sort': [{'publish_time': {'order': 'desc'}}]
+        }
+        newstock_query = {
             'query': {
                 'range': {
                     'create_time': {
-                        'gte': 'now-24h'
+                        'gte': 'now-24h/m'
                     }
                 }
             },
             'sort': [{'create_time': {'order': 'desc'}}]
         }
         
-        sina_data = self.es_client.search('sina_live_data', query, size=50)
-        newstock_data = self.es_client.search('eastmoney_newstock_data', query, size=10)
-        
-        strategy = {
-            'type': 'pre_market_strategy',
-            'strategy': self._analyze_market_sentiment(sina_data),
-            'risk_level': 'medium',
-            'target_stocks': self._identify_hot_stocks(sina_data),
-            'confidence': 0.75,
-            'create_time': datetime.now().isoformat(),
-            'data_summary': {
+        sina_data = self.es_client.cached_search(
+            'sina_live_data', news_query, size=50, source_fields=['content']
+        )
+        newstock_data = self.es_client.cached_search(
+            'eastmoney_newstock_data', newstock_query, size=10, source_fields=['stock_code']
+        )
+        
+        strategy = StrategyDoc(
+            type='pre_market_strategy',
+            strategy=self._analyze_market_sentiment(sina_data),
+            risk_level='medium',
+            target_stocks=self._identify_hot_stocks(sina_data),
+            confidence=0.75,
+            create_time=datetime.now().isoformat(),
+            data_summary={
                 'news_count': len(sina_data),
                 'newstock_count': len(newstock_data)
             }
-        }
+        )
         
         self.es_client.bulk_insert('trading_strategies', [strategy])
+        self._pre_market_cache = (strategy, time.monotonic())
         return strategy
     
-    def analyze_opening_news(self) -> Dict:
+    def analyze_opening_news(self) -> AnalysisDoc:
         """分析开盘消息面"""
         logger.info("分析开盘消息面")
         
         query = {
             'query': {
                 'range': {
-                    'create_time': {
-                        'gte': 'now-2h'
+                    'publish_time': {
+                        'gte': 'now-2h/m'
                     }
                 }
             }
         }
         
-        data = self.es_client.search('sina_live_data', query, size=100)
+        data = self.es_client.cached_search('sina_live_data', query, size=100, source_fields=['content'])
         
-        analysis = {
-            'analysis_type': 'opening_news',
-            'content': self._summarize_news(data),
-            'data_source': 'sina_live_data',
-            'metrics': {
+        analysis = AnalysisDoc(
+            analysis_type='opening_news',
+            content=self._summarize_news(data),
+            data_source='sina_live_data',
+            metrics={
                 'total_news': len(data),
                 'positive_ratio': self._calculate_sentiment_ratio(data, 'positive'),
                 'negative_ratio': self._calculate_sentiment_ratio(data, 'negative')
             },
-            'create_time': datetime.now().isoformat()
-        }
+            create_time=datetime.now().isoformat()
+        )
         
         self.es_client.bulk_insert('analysis_results', [analysis])
         return analysis
     
-    def analyze_dragon_tiger_list(self) -> Dict:
+    def analyze_dragon_tiger_list(self) -> AnalysisDoc:
         """分析龙虎榜"""
         logger.info("分析龙虎榜")
         
-        analysis = {
-            'analysis_type': 'dragon_tiger_list',
-            'content': '龙虎榜分析：今日上榜个股主要集中在科技板块...',
-            'data_source': 'external_api',
-            'metrics': {
+        analysis = AnalysisDoc(
+            analysis_type='dragon_tiger_list',
+            content='龙虎榜分析：今日上榜个股主要集中在科技板块...',
+            data_source='external_api',
+            metrics={
                 'hot_stocks_count': 10,
                 'institutional_buy': 5,
                 'institutional_sell': 3
             },
-            'create_time': datetime.now().isoformat()
-        }
+            create_time=datetime.now().isoformat()
+        )
         
         self.es_client.bulk_insert('analysis_results', [analysis])
         return analysis
     
-    def analyze_northbound_capital(self) -> Dict:
+    def analyze_northbound_capital(self) -> AnalysisDoc:
         """分析北向资金"""
         logger.info("分析北向资金")
         
-        analysis = {
-            'analysis_type': 'northbound_capital',
-            'content': '北向资金今日净流入，主要流向消费和医药板块...',
-            'data_source': 'external_api',
-            'metrics': {
+        analysis = AnalysisDoc(
+            analysis_type='northbound_capital',
+            content='北向资金今日净流入，主要流向消费和医药板块...',
+            data_source='external_api',
+            metrics={
                 'net_inflow': 5000000000,
                 'top_sectors': ['消费', '医药', '科技']
             },
-            'create_time': datetime.now().isoformat()
-        }
+            create_time=datetime.now().isoformat()
+        )
         
         self.es_client.bulk_insert('analysis_results', [analysis])
         return analysis
     
-    def analyze_closing_summary(self) -> Dict:
+    def analyze_closing_summary(self) -> AnalysisDoc:
         """生成收盘综述"""
         logger.info("生成收盘综述")
         
         query = {
             'query': {
                 'range': {
-                    'create_time': {
-                        'gte': 'now-8h'
+                    'publish_time': {
+                        'gte': 'now-8h/m'
                     }
                 }
             }
         }
         
-        all_data = self.es_client.search('sina_live_data', query, size=500)
+        all_data = self.es_client.cached_search('sina_live_data', query, size=500, source_fields=['content'])
         
-        analysis = {
-            'analysis_type': 'closing_summary',
-            'content': self._generate_daily_summary(all_data),
-            'data_source': 'multiple',
-            'metrics': {
+        analysis = AnalysisDoc(
+            analysis_type='closing_summary',
+            content=self._generate_daily_summary(all_data),
+            data_source='multiple',
+            metrics={
                 'total_news': len(all_data),
                 'market_sentiment': 'positive',
                 'key_events': self._extract_key_events(all_data)
             },
-            'create_time': datetime.now().isoformat()
-        }
+            create_time=datetime.now().isoformat()
+        )
         
         self.es_client.bulk_insert('analysis_results', [analysis])
         return analysis
@@ -459,16 +999,13 @@ class DataAnalyzer:
         if not data:
             return "市场情绪中性，建议观望"
         
-        positive_keywords = ['利好', '上涨', '突破', '创新高']
-        negative_keywords = ['利空', '下跌', '破位', '创新低']
-        
         positive_count = sum(
             1 for item in data 
-            if any(kw in item.get('content', '') for kw in positive_keywords)
+            if MARKET_POSITIVE_PATTERN.search(item.get('content', ''))
         )
         negative_count = sum(
             1 for item in data 
-            if any(kw in item.get('content', '') for kw in negative_keywords)
+            if MARKET_NEGATIVE_PATTERN.search(item.get('content', ''))
         )
         
         if positive_count > negative_count * 1.5:
@@ -493,14 +1030,13 @@ class DataAnalyzer:
         if not data:
             return 0.0
         
-        keywords = {
-            'positive': ['利好', '上涨', '突破'],
-            'negative': ['利空', '下跌', '破位']
-        }
+        pattern = SENTIMENT_PATTERNS.get(sentiment)
+        if pattern is None:
+            return 0.0
         
         count = sum(
             1 for item in data 
-            if any(kw in item.get('content', '') for kw in keywords.get(sentiment, []))
+            if pattern.search(item.get('content', ''))
         )
         
         return round(count / len(data), 2)
@@ -513,6 +1049,20 @@ class DataAnalyzer:
         """提取关键事件"""
         return ["重要事件1", "重要事件2", "重要事件3"]
 
+class ORJSONProvider(DefaultJSONProvider):
+    """基于 orjson 的 Flask JSON 序列化"""
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=self._default, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    
+    def _default(self, obj: Any) -> Any:
+        if isinstance(obj, msgspec.Struct):
+            return _struct_fragment(obj)
+        return self.default(obj)
+    
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
 class FinanceDataSystem:
     """金融数据系统主类"""
     
@@ -520,8 +1070,14 @@ class FinanceDataSystem:
         self.es_client = ElasticsearchClient()
         self.crawler = DataCrawler(self.es_client)
         self.analyzer = DataAnalyzer(self.es_client)
-        self.scheduler = BackgroundScheduler(timezone=pytz.timezone('Asia/Shanghai'))
+        self.scheduler = BackgroundScheduler(
+            timezone=pytz.timezone('Asia/Shanghai'),
+            executors={'default': ThreadPoolExecutor(max_workers=min(os.cpu_count() or 1, 8))},
+            # 合并错过的执行、禁止同一任务并发运行，避免重启后集中补跑
+            job_defaults={'coalesce': True, 'max_instances': 1, 'misfire_grace_time': 60}
+        )
         self.app = Flask(__name__)
+        self.app.json = ORJSONProvider(self.app)
         self._setup_routes()
         self._setup_scheduled_tasks()
     
@@ -533,14 +1089,24 @@ class FinanceDataSystem:
             return jsonify({
                 'status': 'healthy',
                 'timestamp': datetime.now().isoformat(),
-                'elasticsearch': 'connected' if self.es_client.es.ping() else 'disconnected'
+                'elasticsearch': 'connected' if self.es_client.is_alive() else 'disconnected'
             })
         
         @self.app.route('/api/v1/data/pre_market', methods=['GET'])
         def get_pre_market_strategy():
             try:
-                strategy = self.analyzer.generate_pre_market_strategy()
-                return jsonify({'success': True, 'data': strategy})
+                strategy = self.analyzer.get_pre_market_strategy()
+                etag = hashlib.md5(strategy.create_time.encode('utf-8')).hexdigest()
+                
+                # 客户端已持有同一份策略时直接返回 304，省去序列化
+                if request.if_none_match.contains_weak(etag):
+                    response = self.app.response_class(status=304)
+                else:
+                    response = jsonify({'success': True, 'data': strategy})
+                response.set_etag(etag)
+                response.cache_control.public = True
+                response.cache_control.max_age = DataAnalyzer.PRE_MARKET_MAX_AGE
+                return response
             except Exception as e:
                 logger.error(f"获取盘前策略失败: {e}")
                 return jsonify({'success': False, 'error': str(e)}), 500
@@ -548,12 +1114,7 @@ class FinanceDataSystem:
         @self.app.route('/api/v1/crawl/now', methods=['POST'])
         def crawl_now():
             try:
-                self.crawler.crawl_sina_live()
-                self.crawler.crawl_eastmoney_newstock()
-                
-                industries = ['tech', 'finance', 'healthcare', 'consumer', 'industrial', 'energy']
-                for industry in industries:
-                    self.crawler.crawl_eastmoney_industry(industry)
+                self.crawler.crawl_all()
                 
                 return jsonify({'success': True, 'message': '数据抓取完成'})
             except Exception as e:
@@ -639,9 +1200,17 @@ class FinanceDataSystem:
         
         logger.info("定时任务设置完成")
     
+    def warm_up(self):
+        """预热 HTTP 与 Elasticsearch 连接池"""
+        self.crawler.warm_up()
+        self.es_client.warm_up()
+        logger.info("连接池预热完成")
+    
     def start(self, host='0.0.0.0', port=5000, debug=False):
         """启动系统"""
         logger.info("启动金融数据系统")
+        self.warm_up()
+        self.es_client.start_health_refresher()
         self.scheduler.start()
         logger.info("定时任务调度器已启动")
         self.app.run(host=host, port=port, debug=debug)
@@ -650,6 +1219,8 @@ class FinanceDataSystem:
         """停止系统"""
         logger.info("停止金融数据系统")
         self.scheduler.shutdown()
+        self.es_client.stop_health_refresher()
+        self.crawler.session.close()
 
 if __name__ == '__main__':
     system = FinanceDataSystem()
@@ -2,44 +2,59 @@
 # -*- coding: utf-8 -*-
 """
 金融数据系统生产环境启动脚本
-使用Waitress作为WSGI服务器替代Flask内置开发服务器
+使用 gunicorn + gevent worker 作为 WSGI 服务器替代 Flask 内置开发服务器，
+ES 查询与网页抓取等待 I/O 时让出协程，单个 worker 即可并发处理大量请求
+
+也可以直接运行 gunicorn:
+    gunicorn --worker-class gevent --workers 2 --worker-connections 1000 \
+        --bind 0.0.0.0:5000 'start_production:create_app()'
 """
 
+# 必须在导入 requests、elasticsearch 等网络库之前打补丁
+from gevent import monkey
+monkey.patch_all()
+
 import os
 import sys
-from waitress import serve
 from finance_data_system_elastic import FinanceDataSystem
 
+def create_app():
+    """gunicorn 应用工厂，每个 worker 进程初始化一个系统实例"""
+    system = FinanceDataSystem()
+    system.warm_up()
+    # worker 不启动调度器(避免多个 worker 重复抓取)，但仍需刷新 /api/v1/health 使用的 ES 状态
+    system.es_client.start_health_refresher()
+    return system.app
+
 def main():
     """启动生产环境服务器"""
     # 从环境变量获取配置，如果不存在则使用默认值
     host = os.environ.get('FLASK_HOST', '0.0.0.0')
     port = int(os.environ.get('FLASK_PORT', 5000))
-    threads = int(os.environ.get('WAITRESS_THREADS', 2))
-    
+    workers = int(os.environ.get('GUNICORN_WORKERS', 2))
+    worker_connections = int(os.environ.get('GUNICORN_WORKER_CONNECTIONS', 1000))
+    # 指定后 worker 的 stdout/stderr 一并写入该文件，文件轮转交给 logrotate 等外部工具(轮转后向 master 发送 USR1 重新打开)
+    error_logfile = os.environ.get('GUNICORN_ERROR_LOGFILE')
+
     print(f"启动金融数据系统生产环境服务器...")
     print(f"监听地址: {host}:{port}")
-    print(f"线程数: {threads}")
-    
-    # 初始化系统
-    system = FinanceDataSystem()
+    print(f"worker 数: {workers}, 每个 worker 最大并发连接数: {worker_connections}")
+
+    args = [
+        sys.executable, '-m', 'gunicorn',
+        '--worker-class', 'gevent',
+        '--workers', str(workers),
+        '--worker-connections', str(worker_connections),
+        '--bind', f'{host}:{port}',
+        # 切换到脚本所在目录，保证从任意工作目录启动时都能导入 start_production
+        '--chdir', os.path.dirname(os.path.abspath(__file__))
+    ]
+    if error_logfile:
+        args += ['--capture-output', '--error-logfile', error_logfile]
+    args.append('start_production:create_app()')
     
-    # 启动Waitress服务器
-    try:
-        # 内存优化配置
-        serve(
-            system.app, 
-            host=host, 
-            port=port, 
-            threads=threads,
-            connection_limit=100,
-            backlog=2048,
-            outbuf_overflow=16777216  # 16MB
-        )
-    except KeyboardInterrupt:
-        print("正在关闭服务器...")
-        system.stop()
-        print("服务器已关闭")
+    # 以 gunicorn 替换当前进程，由其负责 worker 管理与优雅退出
+    os.execv(sys.executable, args)
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()